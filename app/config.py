@@ -90,6 +90,9 @@ class TestingConfig(Config):
     # Use a different Redis database for testing
     REDIS_URL = os.environ.get('TEST_REDIS_URL') or 'redis://localhost:6379/1'
     
+    # Cheapest bcrypt work factor; hashes only need to round-trip in tests
+    BCRYPT_LOG_ROUNDS = 4
+    
     # Session settings for testing
     SESSION_COOKIE_SECURE = False
     
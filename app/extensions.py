@@ -4,6 +4,8 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
 
 
-db = SQLAlchemy()
+# Routes serialize the objects they just committed; keep them loaded instead
+# of expiring them and re-selecting every row for the response
+db = SQLAlchemy(session_options={'expire_on_commit': False})
 migrate = Migrate()
 bcrypt = Bcrypt()
\ No newline at end of file
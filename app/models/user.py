@@ -22,6 +22,8 @@ status_enum_type = db.Enum(StatusEnum, name="status_enum")
 
 class User(db.Model):
     __tablename__ = 'user'
+    # Fetch server-side created_at/updated_at in the INSERT/UPDATE itself
+    __mapper_args__ = {'eager_defaults': True}
 
     id = db.Column(
         UUID(as_uuid=True),
@@ -263,6 +265,40 @@ class User(db.Model):
 
         return cls.query.filter(cls.status == status_enum).all()
 
+    @classmethod
+    def load_accounts(cls, users: List['User']) -> List['User']:
+        """Load the accounts of the given users with a single query"""
+        if users:
+            cls.query.options(db.selectinload(cls.accounts)).filter(
+                cls.id.in_([user.id for user in users])
+            ).all()
+        return users
+
+    @staticmethod
+    def _years_before(day, years: int):
+        """Return the same calendar day `years` earlier (Feb 29 falls back to Feb 28)"""
+        try:
+            return day.replace(year=day.year - years)
+        except ValueError:
+            return day.replace(year=day.year - years, day=28)
+
+    @classmethod
+    def age_range_criteria(
+        cls,
+        min_age: Optional[int] = None,
+        max_age: Optional[int] = None
+    ) -> List[Any]:
+        """Translate an age range into dob bounds usable in a SQL filter"""
+        today = datetime.now().date()
+        criteria: List[Any] = []
+        if min_age is not None:
+            # Old enough once the min_age-th birthday has been reached
+            criteria.append(cls.dob <= cls._years_before(today, min_age))
+        if max_age is not None:
+            # Too old once the (max_age + 1)-th birthday has been reached
+            criteria.append(cls.dob > cls._years_before(today, max_age + 1))
+        return criteria
+
     @classmethod
     def filter_by_age_range(
         cls,
@@ -270,19 +306,12 @@ class User(db.Model):
         max_age: Optional[int] = None
     ) -> List['User']:
         """Filter users by age range"""
-        users = cls.query.filter(cls.deleted_at.is_(None)).all()
-        result: List['User'] = []
-
-        for user in users:
-            age = user.age()
-            if age is not None:
-                if min_age is not None and age < min_age:
-                    continue
-                if max_age is not None and age > max_age:
-                    continue
-                result.append(user)
-
-        return result
+        # Age is derived from dob alone, so let the database filter on the
+        # equivalent dob bounds and only return matching rows
+        return cls.query.filter(
+            cls.deleted_at.is_(None),
+            *cls.age_range_criteria(min_age, max_age)
+        ).all()
 
     # Data integrity methods
     def check_data_integrity(self) -> Dict[str, Any]:
@@ -526,6 +555,7 @@ class User(db.Model):
 
 class Role(db.Model):
     __tablename__ = 'role'
+    __mapper_args__ = {'eager_defaults': True}
 
     id = db.Column(
         UUID(as_uuid=True),
@@ -570,6 +600,7 @@ class AccountRoles(db.Model):
 
 class Account(db.Model):
     __tablename__ = 'account'
+    __mapper_args__ = {'eager_defaults': True}
 
     id = db.Column(
         UUID(as_uuid=True),
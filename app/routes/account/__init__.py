@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify, current_app
 from app.models.user import Account, User, Role, StatusEnum
 from app.schemas.account_schema import AccountSchema, AccountCreateSchema, AccountUpdateSchema, AccountPublicSchema
 from app.extensions import db
+from sqlalchemy.exc import IntegrityError
 import uuid
 from datetime import datetime
 from functools import wraps
@@ -90,8 +91,12 @@ def get_accounts():
         query, username, status, user_id = get_filter_params()
         sort_by, sort_order = get_sort_params()
         
-        # Build the query
-        accounts_query = Account.query
+        # Build the query; user and roles are nested in the response, so
+        # load them for the whole page at once
+        accounts_query = Account.query.options(
+            db.selectinload(Account.user),
+            db.selectinload(Account.roles)
+        )
         
         # Apply filters
         if username:
@@ -99,7 +104,7 @@ def get_accounts():
         
         if status:
             try:
-                status_enum = StatusEnum(status.upper())
+                status_enum = StatusEnum(status.lower())
                 accounts_query = accounts_query.filter(Account.status == status_enum)
             except ValueError:
                 return jsonify({'error': f'Invalid status value: {status}'}), 400
@@ -187,11 +192,6 @@ def create_account():
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
-        # Check if an account with the same username already exists
-        existing_account = Account.query.filter_by(username=account_data['username'], deleted_at=None).first()
-        if existing_account:
-            return jsonify({'error': 'An account with this username already exists'}), 409
-        
         # Create a new account instance
         account = Account()
         account.id = uuid.uuid4()
@@ -211,9 +211,16 @@ def create_account():
         account.deleted_by = account_data.get('deleted_by')
         account.deleted_at = account_data.get('deleted_at')
         
-        # Add the account to the database
+        # Add the account to the database; the unique constraint on username
+        # rejects duplicates, so no separate lookup is needed beforehand
         db.session.add(account)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError as e:
+            db.session.rollback()
+            if 'username' not in str(e.orig):
+                raise
+            return jsonify({'error': 'An account with this username already exists'}), 409
         
         # Serialize the created account using AccountPublicSchema
         response_schema = AccountPublicSchema()
@@ -550,8 +557,12 @@ def search_accounts():
         query, username, status, user_id = get_filter_params()
         sort_by, sort_order = get_sort_params()
         
-        # Build the query
-        accounts_query = Account.query
+        # Build the query; user and roles are nested in the response, so
+        # load them for the whole page at once
+        accounts_query = Account.query.options(
+            db.selectinload(Account.user),
+            db.selectinload(Account.roles)
+        )
         
         # Apply filters
         if username:
@@ -559,7 +570,7 @@ def search_accounts():
         
         if status:
             try:
-                status_enum = StatusEnum(status.upper())
+                status_enum = StatusEnum(status.lower())
                 accounts_query = accounts_query.filter(Account.status == status_enum)
             except ValueError:
                 return jsonify({'error': f'Invalid status value: {status}'}), 400
@@ -645,28 +656,28 @@ def update_account_status(id):
         if not data or 'status' not in data:
             return jsonify({'error': 'Status is required'}), 400
         
-        # Find the account by ID
-        account = Account.query.filter_by(id=id, deleted_at=None).first()
-        if not account:
-            return jsonify({'error': 'Account not found'}), 404
-        
         # Validate the status
         try:
-            new_status = StatusEnum(data['status'].upper())
+            new_status = StatusEnum(data['status'].lower())
         except ValueError:
             return jsonify({'error': f'Invalid status value: {data["status"]}'}), 400
         
-        # Update the status
-        account.status = new_status
-        account.updated_at = db.func.now()
-        account.updated_by = data.get('updated_by')
+        # Update the status with a single UPDATE; only the new status is
+        # returned, so the row never needs to be loaded
+        updated_count = Account.query.filter_by(id=id, deleted_at=None).update({
+            'status': new_status,
+            'updated_at': db.func.now(),
+            'updated_by': data.get('updated_by')
+        }, synchronize_session=False)
+        if not updated_count:
+            return jsonify({'error': 'Account not found'}), 404
         
         # Commit the changes to the database
         db.session.commit()
         
         return jsonify({
             'message': 'Account status updated successfully',
-            'status': account.status.value
+            'status': new_status.value
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -117,7 +117,7 @@ def get_admin_users():
         # Apply filters
         if status:
             try:
-                status_enum = StatusEnum(status.upper())
+                status_enum = StatusEnum(status.lower())
                 users_query = users_query.filter(User.status == status_enum)
             except ValueError:
                 return jsonify({'error': f'Invalid status value: {status}'}), 400
@@ -154,25 +154,19 @@ def get_admin_users():
         # Filter by age range
         if age_min or age_max:
             try:
-                current_users = users_query.all()
-                age_filtered_users = []
-                for user in current_users:
-                    age = user.age()
-                    if age is not None:
-                        if age_min and age < int(age_min):
-                            continue
-                        if age_max and age > int(age_max):
-                            continue
-                        age_filtered_users.append(user)
-                
-                # Since we can't filter by age in the query, we'll paginate the filtered list manually
-                start = (page - 1) * per_page
-                end = start + per_page
-                paginated_users = age_filtered_users[start:end]
+                # Age is derived from dob, so filter on the equivalent dob bounds
+                # and let the database count and slice out the requested page
+                age_filtered_query = users_query.filter(*User.age_range_criteria(
+                    int(age_min) if age_min else None,
+                    int(age_max) if age_max else None
+                ))
+                paginated_users = age_filtered_query.options(db.selectinload(User.accounts)).paginate(
+                    page=page, per_page=per_page, error_out=False
+                )
                 
                 # Serialize the users using UserPublicSchema
                 user_schema = UserPublicSchema(many=True)
-                users_data = user_schema.dump(paginated_users)
+                users_data = user_schema.dump(paginated_users.items)
                 
                 # Prepare the response
                 response_data = {
@@ -180,10 +174,10 @@ def get_admin_users():
                     'pagination': {
                         'page': page,
                         'per_page': per_page,
-                        'total': len(age_filtered_users),
-                        'pages': (len(age_filtered_users) + per_page - 1) // per_page,
-                        'has_next': end < len(age_filtered_users),
-                        'has_prev': start > 0
+                        'total': paginated_users.total,
+                        'pages': paginated_users.pages,
+                        'has_next': paginated_users.has_next,
+                        'has_prev': paginated_users.has_prev
                     }
                 }
                 
@@ -206,8 +200,9 @@ def get_admin_users():
             # Default sorting by created_at descending
             users_query = users_query.order_by(User.created_at.desc())
         
-        # Paginate the results
-        paginated_users = users_query.paginate(
+        # Paginate the results; accounts are nested in the response, so load
+        # them for the whole page at once
+        paginated_users = users_query.options(db.selectinload(User.accounts)).paginate(
             page=page, per_page=per_page, error_out=False
         )
         
@@ -305,8 +300,12 @@ def get_admin_accounts():
         query, username, status, user_id, created_after, created_before, include_deleted = get_account_filter_params()
         sort_by, sort_order = get_sort_params()
         
-        # Build the query
-        accounts_query = Account.query
+        # Build the query; user and roles are nested in the response, so
+        # load them for the whole page at once
+        accounts_query = Account.query.options(
+            db.selectinload(Account.user),
+            db.selectinload(Account.roles)
+        )
         
         # Apply filters
         if username:
@@ -314,7 +313,7 @@ def get_admin_accounts():
         
         if status:
             try:
-                status_enum = StatusEnum(status.upper())
+                status_enum = StatusEnum(status.lower())
                 accounts_query = accounts_query.filter(Account.status == status_enum)
             except ValueError:
                 return jsonify({'error': f'Invalid status value: {status}'}), 400
@@ -403,7 +402,7 @@ def update_user_status(id):
         
         # Validate the status
         try:
-            new_status = StatusEnum(data['status'].upper())
+            new_status = StatusEnum(data['status'].lower())
         except ValueError:
             return jsonify({'error': f'Invalid status value: {data["status"]}'}), 400
         
@@ -440,33 +439,35 @@ def update_account_status(id):
         if not data or 'status' not in data:
             return jsonify({'error': 'Status is required'}), 400
         
-        # Find the account by ID
-        account = Account.query.filter_by(id=id).first() # Include deleted accounts
-        if not account:
-            return jsonify({'error': 'Account not found'}), 404
-        
         # Validate the status
         try:
-            new_status = StatusEnum(data['status'].upper())
+            new_status = StatusEnum(data['status'].lower())
         except ValueError:
             return jsonify({'error': f'Invalid status value: {data["status"]}'}), 400
         
-        # Update the status
-        account.status = new_status
-        account.updated_at = db.func.now()
-        account.updated_by = data.get('updated_by')
+        # Update the status with a single UPDATE; only the new status is
+        # returned, so the row never needs to be loaded
+        values = {
+            'status': new_status,
+            'updated_at': db.func.now(),
+            'updated_by': data.get('updated_by')
+        }
         
         # If the status is DELETED, also set deleted_at timestamp
         if new_status == StatusEnum.DELETED:
-            account.deleted_at = db.func.now()
-            account.deleted_by = data.get('updated_by')
+            values['deleted_at'] = db.func.now()
+            values['deleted_by'] = data.get('updated_by')
+        
+        updated_count = Account.query.filter_by(id=id).update(values, synchronize_session=False) # Include deleted accounts
+        if not updated_count:
+            return jsonify({'error': 'Account not found'}), 404
         
         # Commit the changes to the database
         db.session.commit()
         
         return jsonify({
             'message': 'Account status updated successfully',
-            'status': account.status.value
+            'status': new_status.value
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -562,7 +563,7 @@ def bulk_update_user_status():
         
         # Validate the status
         try:
-            new_status = StatusEnum(data['status'].upper())
+            new_status = StatusEnum(data['status'].lower())
         except ValueError:
             return jsonify({'error': f'Invalid status value: {data["status"]}'}), 400
         
@@ -729,8 +730,11 @@ def validate_user(id):
 @require_admin
 def get_user_permissions(id):
     try:
-        # Find the user by ID
-        user = User.query.filter_by(id=id, deleted_at=None).first()
+        # Find the user by ID, loading every account's roles up front since
+        # the permissions walk all of them
+        user = User.query.options(
+            db.selectinload(User.accounts).selectinload(Account.roles)
+        ).filter_by(id=id, deleted_at=None).first()
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
@@ -807,7 +811,7 @@ def search_admin_users():
         # Apply pagination manually since we used the search method
         start = (page - 1) * per_page
         end = start + per_page
-        paginated_users = users[start:end]
+        paginated_users = User.load_accounts(users[start:end])
         
         # Serialize the users using UserPublicSchema
         user_schema = UserPublicSchema(many=True)
@@ -91,12 +91,13 @@ def get_users():
         sort_by, sort_order = get_sort_params()
         
         # Build the query
-        users_query = User.query
+        # Accounts are nested in the response, so load them for the whole page at once
+        users_query = User.query.options(db.selectinload(User.accounts))
         
         # Apply filters
         if status:
             try:
-                status_enum = StatusEnum(status.upper())
+                status_enum = StatusEnum(status.lower())
                 users_query = users_query.filter(User.status == status_enum)
             except ValueError:
                 return jsonify({'error': f'Invalid status value: {status}'}), 400
@@ -369,7 +370,7 @@ def search_users():
         # Apply pagination manually since we used the search method
         start = (page - 1) * per_page
         end = start + per_page
-        paginated_users = users[start:end]
+        paginated_users = User.load_accounts(users[start:end])
         
         # Serialize the users using UserPublicSchema
         user_schema = UserPublicSchema(many=True)
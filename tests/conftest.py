@@ -1,19 +1,56 @@
 """Test configuration and fixtures"""
 
 import pytest
-from run import create_app
+from sqlalchemy import event
+from app import create_app
 from app.extensions import db
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def app():
     """Create application for testing"""
     app = create_app('testing')
     with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            # pysqlite only emits BEGIN lazily before DML, so a SAVEPOINT would
+            # open (and RELEASE would commit) its own transaction; take over
+            # transaction control so savepoints nest inside db_session's
+            @event.listens_for(db.engine, 'connect')
+            def do_connect(dbapi_connection, connection_record):
+                dbapi_connection.isolation_level = None
+
+            @event.listens_for(db.engine, 'begin')
+            def do_begin(connection):
+                connection.exec_driver_sql('BEGIN')
+
         db.create_all()
+        # Session commits and rollbacks inside a test only touch a savepoint
+        # of the transaction db_session rolls back afterwards
+        db.session.remove()
+        db.session.configure(join_transaction_mode='create_savepoint')
         yield app
-        db.drop_all()
+        # An in-memory database goes away with the process, no need to drop it
+        if db.engine.url.database not in (None, '', ':memory:'):
+            db.drop_all()
+
+@pytest.fixture
+def db_session(app):
+    """Run the test inside a transaction that is rolled back afterwards"""
+    engine = db.engine
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    # Flask-SQLAlchemy resolves binds through db.engines, so pointing the
+    # default bind at this connection makes every session commit join it
+    db.engines[None] = connection
+
+    yield db.session
+
+    db.session.remove()
+    db.engines[None] = engine
+    transaction.rollback()
+    connection.close()
 
 @pytest.fixture
-def client(app):
+def client(app, db_session):
     """Create test client"""
-    return app.test_client()
\ No newline at end of file
+    return app.test_client()
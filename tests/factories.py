@@ -0,0 +1,55 @@
+"""Model factories for tests"""
+
+from datetime import date, datetime
+from functools import lru_cache
+
+import factory
+from factory.alchemy import SQLAlchemyModelFactory
+
+from app.extensions import db, bcrypt
+from app.models.user import User, Account, Role, StatusEnum
+
+DEFAULT_PASSWORD = 'Password123!'
+
+
+@lru_cache(maxsize=None)
+def hash_password(password=DEFAULT_PASSWORD):
+    """Hash a test password once; every account can share the digest"""
+    return bcrypt.generate_password_hash(password).decode('utf-8')
+
+
+class BaseFactory(SQLAlchemyModelFactory):
+    """Commit through the Flask-SQLAlchemy session, so rows join db_session"""
+
+    class Meta:
+        abstract = True
+        sqlalchemy_session = db.session
+        sqlalchemy_session_persistence = 'commit'
+
+
+class UserFactory(BaseFactory):
+    class Meta:
+        model = User
+
+    first_name = factory.Sequence(lambda n: f'User{n}')
+    last_name = 'Test'
+    dob = date(1990, 1, 1)
+    status = StatusEnum.ACTIVE
+
+
+class AccountFactory(BaseFactory):
+    class Meta:
+        model = Account
+
+    user = factory.SubFactory(UserFactory)
+    username = factory.Sequence(lambda n: f'user{n}')
+    password_hash = factory.LazyFunction(hash_password)
+    password_set_on = factory.LazyFunction(datetime.utcnow)
+    status = StatusEnum.ACTIVE
+
+
+class RoleFactory(BaseFactory):
+    class Meta:
+        model = Role
+
+    name = factory.Sequence(lambda n: f'role{n}')
@@ -2,7 +2,8 @@
 
 import pytest
 from app.models.user import User
-from datetime import date
+from datetime import date, timedelta
+from tests.factories import UserFactory
 
 def test_user_creation():
     """Test creating a new user"""
@@ -31,3 +32,30 @@ def test_user_repr():
     
     expected_repr = "<User None - Test User>"
     assert repr(user) == expected_repr
+
+def test_filter_by_age_range(db_session):
+    """Test filtering users by computed age"""
+    today = date.today()
+    UserFactory(first_name="Young", dob=date(today.year - 20, 1, 1))
+    UserFactory(first_name="Old", dob=date(today.year - 70, 1, 1))
+
+    result = User.filter_by_age_range(min_age=30, max_age=80)
+
+    assert [user.first_name for user in result] == ["Old"]
+
+def test_filter_by_age_range_boundaries(db_session):
+    """Test that birthdays on the range edges match the computed age"""
+    today = date.today()
+    turning_30 = User._years_before(today, 30)
+    for first_name, dob in [
+        ("Thirty", turning_30),
+        ("AlmostThirty", turning_30 + timedelta(days=1)),
+        ("Forty", User._years_before(today, 40)),
+        ("JustUnder41", User._years_before(today, 41) + timedelta(days=1)),
+    ]:
+        UserFactory(first_name=first_name, dob=dob)
+
+    result = User.filter_by_age_range(min_age=30, max_age=40)
+
+    assert sorted(user.first_name for user in result) == ["Forty", "JustUnder41", "Thirty"]
+    assert all(30 <= user.age() <= 40 for user in result)
@@ -0,0 +1,13 @@
+"""Fixtures for route tests"""
+
+import pytest
+
+@pytest.fixture(scope='module')
+def client(app):
+    """Create test client shared by the tests in a module"""
+    return app.test_client()
+
+@pytest.fixture(autouse=True)
+def rollback(db_session):
+    """Roll back each route test's writes since the client outlives it"""
+    yield
@@ -0,0 +1,107 @@
+"""Tests for account routes"""
+
+import uuid
+
+import pytest
+from app.models.user import Account, StatusEnum
+from tests.factories import AccountFactory, RoleFactory, UserFactory
+
+AUTH_HEADERS = {'Authorization': 'Bearer token'}
+STATUS_PREFIXES = ['/accounts', '/admin/accounts', '/superadmin/accounts']
+
+def test_create_account(client):
+    """Test creating a new account"""
+    user = UserFactory()
+
+    response = client.post('/accounts/', headers=AUTH_HEADERS, json={
+        'user_id': str(user.id),
+        'username': 'testuser',
+        'password': 'Password123!'
+    })
+
+    assert response.status_code == 201
+    assert response.get_json()['account']['username'] == 'testuser'
+
+def test_create_account_duplicate_username(client):
+    """Test that a taken username is rejected"""
+    user = UserFactory()
+    payload = {
+        'user_id': str(user.id),
+        'username': 'testuser',
+        'password': 'Password123!'
+    }
+    client.post('/accounts/', headers=AUTH_HEADERS, json=payload)
+
+    response = client.post('/accounts/', headers=AUTH_HEADERS, json=payload)
+
+    assert response.status_code == 409
+    assert response.get_json()['error'] == 'An account with this username already exists'
+    # The failed insert only rolls back its own savepoint
+    assert Account.query.filter_by(username='testuser').count() == 1
+
+@pytest.mark.parametrize('url', ['/accounts/', '/accounts/search', '/admin/accounts'])
+def test_list_accounts_includes_user_and_roles(client, url):
+    """Test that listed accounts carry their user and roles"""
+    role = RoleFactory(name='editor')
+    AccountFactory(username='testuser', roles=[role])
+
+    response = client.get(url, headers=AUTH_HEADERS)
+
+    assert response.status_code == 200
+    account = response.get_json()['accounts'][0]
+    assert account['user']['first_name'].startswith('User')
+    assert [r['name'] for r in account['roles']] == ['editor']
+
+@pytest.mark.parametrize('prefix', STATUS_PREFIXES)
+def test_update_account_status(client, db_session, prefix):
+    """Test updating an account's status"""
+    account = AccountFactory(status=StatusEnum.ACTIVE)
+
+    response = client.put(f'{prefix}/{account.id}/status', headers=AUTH_HEADERS,
+                          json={'status': 'suspended', 'updated_by': 'admin'})
+
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'suspended'
+    db_session.refresh(account)
+    assert account.status == StatusEnum.SUSPENDED
+    assert account.updated_by == 'admin'
+    assert account.deleted_at is None
+
+@pytest.mark.parametrize('prefix', STATUS_PREFIXES)
+def test_update_account_status_not_found(client, prefix):
+    """Test updating the status of a missing account"""
+    response = client.put(f'{prefix}/{uuid.uuid4()}/status', headers=AUTH_HEADERS,
+                          json={'status': 'active'})
+
+    assert response.status_code == 404
+    assert response.get_json()['error'] == 'Account not found'
+
+@pytest.mark.parametrize('prefix, soft_deletes', [
+    ('/accounts', False),
+    ('/admin/accounts', True),
+    ('/superadmin/accounts', True),
+])
+def test_update_account_status_deleted(client, db_session, prefix, soft_deletes):
+    """Test setting an account's status to deleted"""
+    account = AccountFactory()
+
+    response = client.put(f'{prefix}/{account.id}/status', headers=AUTH_HEADERS,
+                          json={'status': 'deleted', 'updated_by': 'admin'})
+
+    assert response.status_code == 200
+    db_session.refresh(account)
+    assert account.status == StatusEnum.DELETED
+    # Only the admin routes stamp the soft-delete columns
+    assert (account.deleted_at is not None) == soft_deletes
+    assert account.deleted_by == ('admin' if soft_deletes else None)
+
+@pytest.mark.parametrize('url', ['/accounts/', '/accounts/search', '/admin/accounts'])
+def test_list_accounts_filters_by_status(client, url):
+    """Test filtering listed accounts by status"""
+    AccountFactory(username='active', status=StatusEnum.ACTIVE)
+    AccountFactory(username='suspended', status=StatusEnum.SUSPENDED)
+
+    response = client.get(url, headers=AUTH_HEADERS, query_string={'status': 'SUSPENDED'})
+
+    assert response.status_code == 200
+    assert [a['username'] for a in response.get_json()['accounts']] == ['suspended']
@@ -1,8 +1,21 @@
 """Tests for user routes"""
 
 import json
-from app.models.user import User
+import pytest
 from datetime import date
+from tests.factories import AccountFactory
+
+USER_PAYLOAD = {
+    'first_name': 'Test',
+    'middle_name': 'Middle',
+    'last_name': 'User',
+    'dob': '1990-01-01',
+    'designation': 'Developer',
+    'department': 'Engineering',
+    'status': 'active',
+    'updated_by': 'admin'
+}
+USER_BODY = json.dumps(USER_PAYLOAD)
 
 def test_get_users(client):
     """Test getting all users"""
@@ -12,19 +25,35 @@ def test_get_users(client):
 
 def test_create_user(client):
     """Test creating a new user"""
-    user_data = {
-        'first_name': 'Test',
-        'middle_name': 'Middle',
-        'last_name': 'User',
-        'dob': '1990-01-01',
-        'designation': 'Developer',
-        'department': 'Engineering',
-        'status': 'active',
-        'updated_by': 'admin'
-    }
-    
     response = client.post('/api/v1/users/',
-                          data=json.dumps(user_data),
+                          data=USER_BODY,
                           content_type='application/json')
     
     assert response.status_code == 201
+
+def test_get_users_includes_accounts(client):
+    """Test that listed users carry their accounts"""
+    AccountFactory(username='testuser')
+
+    response = client.get('/users/', headers={'Authorization': 'Bearer token'})
+
+    assert response.status_code == 200
+    users = response.get_json()['users']
+    assert [a['username'] for a in users[0]['accounts']] == ['testuser']
+
+@pytest.mark.parametrize('url', ['/admin/users', '/superadmin/users'])
+def test_get_users_filtered_by_age_paginates(client, url):
+    """Test that the age filter counts every match but returns one page"""
+    today = date.today()
+    for years in (20, 35, 40, 45, 70):
+        AccountFactory(user__dob=date(today.year - years - 1, 1, 1))
+
+    response = client.get(url, headers={'Authorization': 'Bearer token'},
+                          query_string={'age_min': 30, 'age_max': 60, 'per_page': 2})
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['pagination']['total'] == 3
+    assert data['pagination']['has_next'] is True
+    assert len(data['users']) == 2
+    assert all(len(user['accounts']) == 1 for user in data['users'])
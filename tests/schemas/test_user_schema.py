@@ -1,16 +1,23 @@
 """Tests for user schema"""
 
-from datetime import datetime
+import pytest
+from datetime import date, datetime
 from app.schemas.user_schema import UserSchema, UserCreateSchema, UserUpdateSchema
 
-def test_user_schema_serialization():
+# Schemas are stateless between load/dump calls, so build them once per module
+USER_SCHEMA = UserSchema()
+USER_CREATE_SCHEMA = UserCreateSchema()
+USER_UPDATE_SCHEMA = UserUpdateSchema()
+
+@pytest.mark.parametrize('dob', ['1990-01-01', date(1990, 1, 1)])
+def test_user_schema_serialization(dob):
     """Test serializing user data"""
     user_data = {
         'id': '123e4567-e89b-12d3-a456-426614174000',
         'first_name': 'Test',
         'middle_name': 'Middle',
         'last_name': 'User',
-        'dob': '1990-01-01',
+        'dob': dob,
         'designation': 'Developer',
         'department': 'Engineering',
         'status': 'active',
@@ -22,15 +29,13 @@ def test_user_schema_serialization():
         'accounts': []
     }
     
-    schema = UserSchema()
-    result = schema.dump(user_data)
+    result = USER_SCHEMA.dump(user_data)
     
     assert result['first_name'] == 'Test'
     assert result['last_name'] == 'User'
 
-def test_user_schema_deserialization():
-    """Test deserializing user data"""
-    user_data = {
+@pytest.mark.parametrize('schema, user_data', [
+    (USER_CREATE_SCHEMA, {
         'first_name': 'Test',
         'middle_name': 'Middle',
         'last_name': 'User',
@@ -41,17 +46,8 @@ def test_user_schema_deserialization():
         'updated_by': 'admin',
         'deleted_by': None,
         'deleted_at': None
-    }
-    
-    schema = UserCreateSchema()
-    result = schema.load(user_data)
-    
-    assert result['first_name'] == 'Test'
-    assert result['last_name'] == 'User'
-    
-def test_user_update_schema():
-    """Test user update schema"""
-    user_data = {
+    }),
+    (USER_UPDATE_SCHEMA, {
         'first_name': 'Updated',
         'middle_name': 'Middle',
         'last_name': 'User',
@@ -60,10 +56,11 @@ def test_user_update_schema():
         'department': 'Engineering',
         'status': 'inactive',
         'updated_by': 'admin'
-    }
-    
-    schema = UserUpdateSchema()
+    }),
+], ids=['create', 'update'])
+def test_user_schema_deserialization(schema, user_data):
+    """Test deserializing user data with the create and update schemas"""
     result = schema.load(user_data)
     
-    assert result['first_name'] == 'Updated'
+    assert result['first_name'] == user_data['first_name']
     assert result['last_name'] == 'User'